@@ -38,6 +38,11 @@ class Settings(BaseSettings):
         default=3600,
         description="TTL in seconds to cache URL validation results",
     )
+    url_validation_concurrency: int = Field(
+        default=16,
+        ge=1,
+        description="Maximum number of URL validation requests in flight at once",
+    )
 
     @field_validator("log_level")
     @classmethod
@@ -2,22 +2,45 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from ..config.settings import Settings
 from ..infrastructure.adapters.stars_api_graphql import StarsAPIAdapter
 from ..utils.stars_client import StarsClient
 from . import __init__ as _di_pkg  # noqa: F401  # Ensure package recognized
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    # Parsed once per process; call get_settings.cache_clear() after env changes.
     return Settings()
 
 
+# One client per endpoint/token so its connection pool survives across tool
+# calls. Kept in a plain dict (not an LRU) so no pool is dropped unclosed.
+_stars_clients: dict[tuple[str, str], StarsClient] = {}
+
+
 def get_stars_client(settings: Settings | None = None) -> StarsClient:
     settings = settings or get_settings()
-    token = settings.stars_api_token or ""
-    return StarsClient(api_url=settings.stars_api_url, token=token)
+    key = (settings.stars_api_url, settings.stars_api_token or "")
+    client = _stars_clients.get(key)
+    if client is None:
+        client = _stars_clients[key] = StarsClient(api_url=key[0], token=key[1])
+    return client
 
 
-def get_stars_api(settings: Settings | None = None) -> StarsAPIAdapter:
-    client = get_stars_client(settings)
+async def aclose_stars_clients() -> None:
+    """Close the pools of all cached clients; each reopens on its next request."""
+    for client in list(_stars_clients.values()):
+        await client.aclose()
+
+
+@lru_cache(maxsize=4)
+def _stars_api_for(client: StarsClient) -> StarsAPIAdapter:
+    # The adapter is stateless over its client, so one per client is enough.
     return StarsAPIAdapter(client)
+
+
+def get_stars_api(settings: Settings | None = None) -> StarsAPIAdapter:
+    return _stars_api_for(get_stars_client(settings))
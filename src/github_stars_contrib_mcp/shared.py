@@ -2,6 +2,8 @@
 
 import logging
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 import structlog
 
@@ -13,7 +15,9 @@ from fastmcp import FastMCP
 sys.stdout = _original_stdout
 
 from .config.settings import settings
+from .di.container import aclose_stars_clients
 from .utils.stars_client import StarsClient
+from .utils.url_check import aclose_client as aclose_url_check_client
 
 
 def _configure_logging() -> None:
@@ -50,7 +54,24 @@ def _configure_logging() -> None:
 
 _configure_logging()
 
-mcp = FastMCP("GitHub Stars Contributions MCP Server")
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[dict]:
+    """Close pooled HTTP clients when the server shuts down.
+
+    FastMCP >= 2.13 enters this once per server run and shares it across
+    sessions, so closing process-wide clients here cannot cut off a session.
+    """
+    try:
+        yield {}
+    finally:
+        await aclose_url_check_client()
+        if stars_client is not None:
+            await stars_client.aclose()
+        await aclose_stars_clients()
+
+
+mcp = FastMCP("GitHub Stars Contributions MCP Server", lifespan=_lifespan)
 
 stars_client: StarsClient | None = None
 
@@ -69,8 +90,12 @@ async def initialize_stars_client() -> None:
             api_url="https://api-stars.github.com/", token=settings.stars_api_token
         )
 
-        # Validate token by fetching user data
-        result = await stars_client.get_user_data()
+        # Validate token by fetching user data. This runs in the short-lived
+        # start-up loop, so release its connections before that loop ends.
+        try:
+            result = await stars_client.get_user_data()
+        finally:
+            await stars_client.aclose()
         if not result["ok"] or result.get("data") is None:
             raise ValueError(
                 f"Invalid STARS_API_TOKEN: {result['error'] or 'No user data'}"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 
 import structlog
@@ -35,36 +36,44 @@ class CreateContributionsArgs(BaseModel):
 async def create_contributions_impl(data: list[dict]) -> dict:
     """Implementation: validates input and calls Stars API client."""
     try:
-        payload = CreateContributionsArgs(
-            data=[ContributionInput(**item) for item in data]
-        )
+        # Validate the whole list in one pass instead of building each item first
+        payload = CreateContributionsArgs.model_validate({"data": data})
     except ValidationError as e:
-        return {"success": False, "error": e.errors()}
-
-    items = []
-    for i in payload.data:
-        # Optional URL validation behind flag
-        if settings.validate_urls:
-            ok, reason = await check_url_head(
-                str(i.url), timeout_s=settings.url_validation_timeout_s
-            )
+        # Drop the wrapper's "data" so locations read (item_index, field)
+        errors = [{**err, "loc": err["loc"][1:]} for err in e.errors()]
+        return {"success": False, "error": errors}
+
+    # Optional URL validation behind flag; probes run concurrently (bounded by
+    # url_validation_concurrency) and the first failing item in input order is
+    # reported.
+    if settings.validate_urls:
+        urls = [str(i.url) for i in payload.data]
+        sem = asyncio.Semaphore(settings.url_validation_concurrency)
+
+        async def _check(url: str) -> tuple[bool, str | None]:
+            async with sem:
+                return await check_url_head(
+                    url, timeout_s=settings.url_validation_timeout_s
+                )
+
+        checks = await asyncio.gather(*(_check(url) for url in urls))
+        for url, (ok, reason) in zip(urls, checks, strict=True):
             if not ok:
                 logger.warning(
-                    "create_contributions.url_invalid", url=str(i.url), reason=reason
+                    "create_contributions.url_invalid", url=url, reason=reason
                 )
-                return {
-                    "success": False,
-                    "error": f"Invalid URL ({reason}) for: {i.url}",
-                }
-        items.append(
-            {
-                "title": i.title,
-                "url": str(i.url),
-                "description": normalize_description(i.description),
-                "type": i.type,  # str Enum, JSON-serializable
-                "date": i.date.isoformat(),
-            }
-        )
+                return {"success": False, "error": f"Invalid URL ({reason}) for: {url}"}
+
+    items = [
+        {
+            "title": i.title,
+            "url": str(i.url),
+            "description": normalize_description(i.description),
+            "type": i.type,  # str Enum, JSON-serializable
+            "date": i.date.isoformat(),
+        }
+        for i in payload.data
+    ]
     try:
         use_case = CreateContributions(get_stars_api())
         data = await use_case(items)
@@ -4,9 +4,13 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class APIResult:
-    """Result of an API operation."""
+    """Result of an API operation.
+
+    Slotted, so ``ok``/``data``/``error`` are plain slot reads and
+    ``__getattr__`` only runs for names proxied into ``data``.
+    """
 
     ok: bool
     data: dict[str, Any] | None = None
@@ -27,7 +31,9 @@ class APIResult:
         the payload is returned under `data = {"ids": [...]}`.
         """
         if name in {"ok", "data", "error"}:
-            return super().__getattribute__(name)
-        if self.data and isinstance(self.data, dict) and name in self.data:
-            return self.data[name]
+            # Slot not populated yet (e.g. during copy/unpickle); avoid recursion.
+            raise AttributeError(name)
+        data = self.data
+        if isinstance(data, dict) and name in data:
+            return data[name]
         raise AttributeError(name)
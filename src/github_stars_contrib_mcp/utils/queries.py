@@ -176,6 +176,7 @@ UPDATE_PROFILE_MUTATION = """
     mutation UpdateProfile($data: NomineeProfileInput!) {
         updateProfile(data: $data) {
             id
+            bio
             __typename
         }
     }
@@ -1,11 +1,11 @@
 """GitHub Stars API client."""
 # isort: skip_file
 
-from typing import Any
-import json
+from typing import TYPE_CHECKING, Any
+import asyncio
 import time
 
-import httpx
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential
 import structlog
 
@@ -24,6 +24,9 @@ from .queries import (
     USER_QUERY,
 )
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = structlog.get_logger(__name__)
 
 
@@ -43,6 +46,46 @@ class StarsClient:
         # Also include Authorization as a fallback if server supports bearer tokens
         if self.token:
             self._headers["Authorization"] = f"Bearer {self.token}"
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    async def _get_http_client(self) -> "httpx.AsyncClient":
+        """Return the pooled HTTP/2 client, creating it on first use in this loop.
+
+        httpx connections belong to the event loop that opened them, so a client
+        left over from another loop is closed and replaced rather than reused.
+        """
+        # Imported on first request rather than at module import, to keep
+        # server start-up lean; afterwards this is a sys.modules lookup.
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        client = self._client
+        if client is not None and not client.is_closed and self._client_loop is loop:
+            return client
+        # Install the replacement before awaiting anything so concurrent
+        # callers share it instead of each building their own.
+        self._client = httpx.AsyncClient(
+            timeout=30,
+            headers=self._headers,
+            cookies=self._cookies,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+        self._client_loop = loop
+        fresh = self._client
+        if client is not None and not client.is_closed:
+            try:
+                await client.aclose()
+            except Exception as e:  # its transports may belong to a closed loop
+                logger.debug("stars_client.stale_client_close_failed", error=str(e))
+        return fresh
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client; the next request opens a new one."""
+        client, self._client, self._client_loop = self._client, None, None
+        if client is not None:
+            await client.aclose()
 
     # Contribution methods
     async def create_contributions(self, items: list[dict[str, Any]]) -> APIResult:
@@ -246,71 +289,65 @@ class StarsClient:
 
         Returns a dict with keys: ok (bool), data (dict | None), error (str | None).
         """
-        payload = {"query": query, "variables": variables or {}}
+        body = orjson.dumps({"query": query, "variables": variables or {}})
         op_name = op or "unknown"
+        body_bytes = len(body)
         start = time.monotonic()
-        async with httpx.AsyncClient(
-            timeout=30, headers=self._headers, cookies=self._cookies
-        ) as client:
-            resp = await client.post(self.api_url, json=payload)
-            duration_ms = int((time.monotonic() - start) * 1000)
-            if resp.status_code >= 400:
-                logger.warning(
-                    "stars_client.request_failed",
-                    op=op_name,
-                    http_status=resp.status_code,
-                    duration_ms=duration_ms,
-                    request_size=len(json.dumps(payload.get("variables", {})))
-                    if payload.get("variables")
-                    else 0,
-                    response_size=len(resp.text) if resp.text else 0,
-                    error_kind="http_error",
-                )
-                return {
-                    "ok": False,
-                    "data": None,
-                    "error": f"HTTP {resp.status_code}: {resp.text}",
-                }
-            try:
-                data = resp.json()
-            except json.JSONDecodeError:
-                logger.warning(
-                    "stars_client.request_failed",
-                    op=op_name,
-                    duration_ms=duration_ms,
-                    request_size=len(json.dumps(payload.get("variables", {})))
-                    if payload.get("variables")
-                    else 0,
-                    response_size=len(resp.text) if resp.text else 0,
-                    error_kind="json_error",
-                )
-                return {"ok": False, "data": None, "error": "Invalid JSON response"}
-
-            if "errors" in data and data["errors"]:
-                logger.warning(
-                    "stars_client.request_failed",
-                    op=op_name,
-                    duration_ms=duration_ms,
-                    request_size=len(json.dumps(payload.get("variables", {})))
-                    if payload.get("variables")
-                    else 0,
-                    response_size=len(resp.text) if resp.text else 0,
-                    error_kind="graphql_error",
-                )
-                return {
-                    "ok": False,
-                    "data": None,
-                    "error": data["errors"][0].get("message", "Unknown error"),
-                }
-
-            logger.info(
-                "stars_client.request_ok",
+        client = await self._get_http_client()
+        # The client's default headers already set Content-Type: application/json.
+        resp = await client.post(self.api_url, content=body)
+        duration_ms = int((time.monotonic() - start) * 1000)
+        # Sized from the raw bytes so logging never decodes the body to text.
+        response_bytes = len(resp.content)
+        if resp.status_code >= 400:
+            logger.warning(
+                "stars_client.request_failed",
                 op=op_name,
-                duration_ms=duration_ms,
                 http_status=resp.status_code,
-                request_size=len(json.dumps(payload.get("variables", {})))
-                if payload.get("variables")
-                else 0,
-                response_size=len(resp.text) if resp.text else 0,
+                duration_ms=duration_ms,
+                body_bytes=body_bytes,
+                response_bytes=response_bytes,
+                error_kind="http_error",
             )
-            return {"ok": True, "data": data.get("data", {}), "error": None}
+            return {
+                "ok": False,
+                "data": None,
+                "error": f"HTTP {resp.status_code}: {resp.text}",
+            }
+        try:
+            data = orjson.loads(resp.content)
+        except orjson.JSONDecodeError:
+            logger.warning(
+                "stars_client.request_failed",
+                op=op_name,
+                duration_ms=duration_ms,
+                body_bytes=body_bytes,
+                response_bytes=response_bytes,
+                error_kind="json_error",
+            )
+            return {"ok": False, "data": None, "error": "Invalid JSON response"}
+
+        if "errors" in data and data["errors"]:
+            logger.warning(
+                "stars_client.request_failed",
+                op=op_name,
+                duration_ms=duration_ms,
+                body_bytes=body_bytes,
+                response_bytes=response_bytes,
+                error_kind="graphql_error",
+            )
+            return {
+                "ok": False,
+                "data": None,
+                "error": data["errors"][0].get("message", "Unknown error"),
+            }
+
+        logger.info(
+            "stars_client.request_ok",
+            op=op_name,
+            duration_ms=duration_ms,
+            http_status=resp.status_code,
+            body_bytes=body_bytes,
+            response_bytes=response_bytes,
+        )
+        return {"ok": True, "data": data.get("data", {}), "error": None}
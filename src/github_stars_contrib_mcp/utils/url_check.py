@@ -1,46 +1,195 @@
 from __future__ import annotations
 
+import asyncio
 import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit, urlunsplit
 
-import httpx
 import structlog
 
 from ..config.settings import settings
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = structlog.get_logger(__name__)
 
 
-_cache: dict[str, tuple[float, tuple[bool, str | None]]] = {}
+CheckResult = tuple[bool, str | None]
 
 
-async def check_url_head(
-    url: str, timeout_s: int | None = None
-) -> tuple[bool, str | None]:
-    """Perform a lightweight HEAD request to validate URL accessibility.
+class _TTLCache:
+    """LRU cache of bounded size whose entries expire after a per-entry TTL."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._data: OrderedDict[str, tuple[float, CheckResult]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> CheckResult | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: CheckResult, ttl: float) -> None:
+        if ttl <= 0:
+            self._data.pop(key, None)
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+_cache = _TTLCache(maxsize=4096)
+_inflight: dict[str, asyncio.Task[CheckResult]] = {}
 
-    Returns (ok, reason). On success, reason is None. Results are cached for TTL.
+# Shared client so repeated HEAD probes reuse keep-alive connections. It, the
+# lock and the in-flight tasks all belong to the event loop in _loop.
+_client: httpx.AsyncClient | None = None
+_client_lock = asyncio.Lock()
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def _adopt_running_loop() -> None:
+    """Drop loop-bound state left over from a previous event loop.
+
+    httpx connections, asyncio locks and tasks cannot be used from another loop
+    (the server validates its token in a short-lived loop, and tests may run
+    several), so they are rebuilt the first time a new loop calls in.
     """
-    ttl = max(0, int(settings.url_validation_ttl_s))
-    now = time.time()
-    cached = _cache.get(url)
-    if cached and (now - cached[0]) < ttl:
-        return cached[1]
-
-    timeout = (
-        timeout_s if timeout_s is not None else int(settings.url_validation_timeout_s)
-    )
+    global _client, _client_lock, _loop
+    loop = asyncio.get_running_loop()
+    if _loop is loop:
+        return
+    stale, _client = _client, None
+    _client_lock = asyncio.Lock()
+    _inflight.clear()
+    _loop = loop
+    if stale is not None and not stale.is_closed:
+        try:
+            await stale.aclose()
+        except Exception as e:  # its transports may belong to a closed loop
+            logger.debug("url_check.stale_client_close_failed", error=str(e))
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """Return the shared HEAD-probe client, creating it on first use."""
+    import httpx  # deferred so importing the tools does not load httpx
+
+    global _client
+    await _adopt_running_loop()
+    if _client is None or _client.is_closed:
+        async with _client_lock:
+            if _client is None or _client.is_closed:
+                # url_validation_concurrency bounds each tool call (via its own
+                # semaphore), not the process: concurrent calls share this pool.
+                # Capping total connections here would make probes queue for a
+                # slot and fail with PoolTimeout, reported as an invalid URL, so
+                # only the idle keep-alive connections are capped.
+                keepalive = int(settings.url_validation_concurrency)
+                _client = httpx.AsyncClient(
+                    timeout=int(settings.url_validation_timeout_s),
+                    follow_redirects=True,
+                    limits=httpx.Limits(
+                        max_connections=None, max_keepalive_connections=keepalive
+                    ),
+                )
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared client; the next check creates a fresh one."""
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        await client.aclose()
+
+
+# HEAD statuses that may mean "HEAD not supported" rather than "no such page".
+_HEAD_REJECTED = frozenset({403, 405, 501})
+
+
+async def _probe(url: str, timeout: int) -> CheckResult:
+    import httpx
+
     try:
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-            resp = await client.head(url)
-            if resp.status_code >= 400:
-                result = (False, f"status {resp.status_code}")
-            else:
-                result = (True, None)
+        client = await _get_client()
+        resp = await client.head(url, timeout=timeout)
+        status = resp.status_code
+        if status in _HEAD_REJECTED:
+            # Some hosts reject HEAD but serve GET; confirm with a one-byte
+            # ranged GET and close it without reading the body.
+            async with client.stream(
+                "GET", url, headers={"Range": "bytes=0-0"}, timeout=timeout
+            ) as get_resp:
+                status = get_resp.status_code
+        if status >= 400:
+            return (False, f"status {status}")
+        return (True, None)
     except httpx.TimeoutException:
-        result = (False, "timeout")
+        return (False, "timeout")
     except Exception as e:  # Broad but logged; we only need a boolean gate
         logger.debug("url_check.error", url=url, error=str(e))
-        result = (False, "error")
+        return (False, "error")
+
+
+async def _probe_and_cache(key: str, url: str, timeout: int) -> CheckResult:
+    try:
+        result = await _probe(url, timeout)
+        # A timeout may be transient rather than a property of the URL, so
+        # don't cache it.
+        if result != (False, "timeout"):
+            _cache.set(key, result, ttl=max(0, int(settings.url_validation_ttl_s)))
+        return result
+    finally:
+        _inflight.pop(key, None)
+
+
+def _norm(url: str) -> str:
+    """Cache key for ``url``: case-folded scheme/host, no trailing slash or fragment."""
+    p = urlsplit(url)
+    # Userinfo is case-sensitive, so fold only the host[:port] part
+    userinfo, at, hostport = p.netloc.rpartition("@")
+    netloc = userinfo + at + hostport.lower()
+    return urlunsplit(
+        (p.scheme.lower(), netloc, p.path.rstrip("/") or "/", p.query, "")
+    )
+
+
+async def check_url_head(url: str, timeout_s: int | None = None) -> CheckResult:
+    """Perform a lightweight HEAD request to validate URL accessibility.
+
+    Returns (ok, reason). On success, reason is None. Results are cached for TTL,
+    and concurrent checks of the same URL share a single request.
+    """
+    key = _norm(url)
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
 
-    _cache[url] = (now, result)
-    return result
+    await _adopt_running_loop()
+    task = _inflight.get(key)
+    if task is None:
+        timeout = (
+            timeout_s
+            if timeout_s is not None
+            else int(settings.url_validation_timeout_s)
+        )
+        task = asyncio.create_task(_probe_and_cache(key, url, timeout))
+        _inflight[key] = task
+    # The probe runs in its own task, so cancelling any one caller (including
+    # the one that started it) leaves the others waiting on a live probe.
+    return await asyncio.shield(task)
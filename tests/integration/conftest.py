@@ -1,60 +1,83 @@
 """Integration-level pytest fixtures.
 
 These fixtures wire a real StarsClient into shared.stars_client for tool impl
-tests, provide gating for token presence and mutation allowance, and can boot
-the MCP server for end-to-end scenarios.
+tests and can boot the MCP server for end-to-end scenarios. Token and mutation
+gating lives in the ``requires_token`` / ``requires_mutations`` markers from
+test_integration_utils.
 """
 
 from __future__ import annotations
 
 import os
+import re
 import socket
 import subprocess
 import sys
+import threading
 import time
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
 from contextlib import closing
 
 import pytest
+import pytest_asyncio
 
 from github_stars_contrib_mcp import shared
 from github_stars_contrib_mcp.utils.stars_client import StarsClient
 
+from .test_integration_utils import (
+    generate_unique_url,
+    get_current_iso_datetime,
+    get_test_client,
+)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def stars_client() -> AsyncIterator[StarsClient]:
+    """One StarsClient shared by every live integration test in the session.
+
+    Token/mutation gating stays in each test; building the client needs no
+    network access, so it is safe to create even when tests end up skipped.
+    Its pooled connections are closed when the session ends.
+    """
+    client = get_test_client()
+    yield client
+    await client.aclose()
 
-@pytest.fixture
-def require_token():
-    """Skip test if STARS_API_TOKEN is not present."""
-    if not os.getenv("STARS_API_TOKEN"):
-        pytest.skip("STARS_API_TOKEN not set; skipping integration test")
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def token_probe(stars_client: StarsClient):
+    """get_user_data() response fetched once per session.
+
+    Read-only tests inspect it to decide whether the token can see loggedUser,
+    instead of each issuing its own probe request. Callers gate themselves with
+    ``requires_token``.
+    """
+    return await stars_client.get_user_data()
 
 
 @pytest.fixture
-def mutations_enabled(require_token):  # depends on token check
-    """Skip test if STARS_E2E_MUTATE is not truthy (1/true/True)."""
-    allow = os.getenv("STARS_E2E_MUTATE", "0") in ("1", "true", "True")
-    if not allow:
-        pytest.skip(
-            "Mutation e2e disabled; set STARS_API_TOKEN and STARS_E2E_MUTATE=1 to run"
-        )
+def now_iso() -> str:
+    """Current UTC timestamp in ISO format, computed before the test body runs."""
+    return get_current_iso_datetime()
 
 
 @pytest.fixture
-def stars_client_real(require_token) -> StarsClient:
-    """Provide a real StarsClient configured from env vars."""
-    api_url = os.getenv("STARS_API_URL", "https://api-stars.github.com/")
-    token = os.getenv("STARS_API_TOKEN")
-    return StarsClient(api_url=api_url, token=token)
+def unique_url(request) -> str:
+    """Unique example.com URL namespaced by the requesting test's name."""
+    return generate_unique_url(f"github-stars-mcp-{request.node.name}")
+
+
+@pytest.fixture(scope="session")
+def bio_nonce() -> int:
+    """Timestamp nonce for profile bio edits, fixed for the whole session."""
+    return int(time.time())
 
 
 @pytest.fixture
-def wire_shared_real_client(stars_client_real):
-    """Set shared.stars_client to real client for the duration of the test."""
-    original = shared.stars_client
-    shared.stars_client = stars_client_real
-    try:
-        yield stars_client_real
-    finally:
-        shared.stars_client = original
+def wire_shared(stars_client, monkeypatch) -> StarsClient:
+    """Point shared.stars_client at the session client; reverted after the test."""
+    monkeypatch.setattr(shared, "stars_client", stars_client)
+    return stars_client
 
 
 def _find_free_port() -> int:
@@ -64,14 +87,50 @@ def _find_free_port() -> int:
         return s.getsockname()[1]
 
 
-def _wait_for_port(host: str, port: int, timeout: float = 10.0) -> bool:
-    deadline = time.time() + timeout
-    while time.time() < deadline:
+# Uvicorn logs this line once the socket is bound and accepting connections.
+_READY_MARKER = re.compile(r"Uvicorn running on https?://")
+
+
+def _drain_output(stream, lines: list[str], ready: threading.Event) -> None:
+    """Collect server output and flag readiness when the listening marker appears.
+
+    Draining the pipe continuously also keeps the child from blocking on a full
+    pipe buffer while the tests run.
+    """
+    for raw in iter(stream.readline, b""):
+        line = raw.decode(errors="replace")
+        lines.append(line)
+        if not ready.is_set() and _READY_MARKER.search(line):
+            ready.set()
+    stream.close()
+
+
+def _wait_for_port(
+    host: str,
+    port: int,
+    timeout: float = 10.0,
+    ready: threading.Event | None = None,
+) -> bool:
+    """Wait until the server is reachable.
+
+    Returns as soon as `ready` is set or a TCP connect succeeds; between probes it
+    backs off exponentially from 10ms so a fast startup is not penalised.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while time.monotonic() < deadline:
+        if ready is not None and ready.is_set():
+            return True
         try:
             with closing(socket.create_connection((host, port), timeout=0.5)):
                 return True
         except OSError:
-            time.sleep(0.1)
+            pass
+        if ready is not None:
+            ready.wait(delay)
+        else:
+            time.sleep(delay)
+        delay = min(delay * 2, 0.5)
     return False
 
 
@@ -100,27 +159,23 @@ def mcp_server() -> Iterator[str]:
 
     cmd = [sys.executable, "-m", "github_stars_contrib_mcp.server"]
     proc = subprocess.Popen(
-        cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+    )
+    output: list[str] = []
+    ready = threading.Event()
+    reader = threading.Thread(
+        target=_drain_output, args=(proc.stdout, output, ready), daemon=True
     )
+    reader.start()
 
-    # Wait for port to be ready
-    if not _wait_for_port(host, port, timeout=15.0):
+    # Wait for the listening marker (or the port, whichever comes first)
+    if not _wait_for_port(host, port, timeout=15.0, ready=ready):
         proc.kill()
-        try:
-            try:
-                out, err = proc.communicate(timeout=2)
-            except Exception as e:
-                pytest.fail(
-                    f"MCP server failed to start on {host}:{port}.\nCould not retrieve output: {e}"
-                )
-            else:
-                pytest.fail(
-                    f"MCP server failed to start on {host}:{port}.\nSTDOUT:\n{out.decode()}\nSTDERR:\n{err.decode()}"
-                )
-        except Exception as e:
-            pytest.fail(
-                f"MCP server failed to start on {host}:{port}.\nCould not retrieve output: {e}"
-            )
+        proc.wait(timeout=5)
+        reader.join(timeout=2)
+        pytest.fail(
+            f"MCP server failed to start on {host}:{port}.\nOUTPUT:\n{''.join(output)}"
+        )
 
     server_url = f"http://{host}:{port}{path}"
     try:
@@ -16,14 +16,12 @@ class FakeStarsClientFail:
         return APIResult(False, None, "nope")
 
 
-@pytest.mark.asyncio
 async def test_adapter_returns_data_on_success():
     adapter = StarsAPIAdapter(FakeStarsClientOK())
     data = await adapter.get_user_data()
     assert data["viewer"]["login"] == "ok-user"
 
 
-@pytest.mark.asyncio
 async def test_adapter_raises_on_error():
     adapter = StarsAPIAdapter(FakeStarsClientFail())
     with pytest.raises(RuntimeError, match="nope"):
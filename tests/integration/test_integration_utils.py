@@ -16,18 +16,16 @@ def should_skip_mutations():
     return not (token and allow)
 
 
-def skip_if_no_mutations():
-    """Skip test if mutations are not enabled."""
-    if should_skip_mutations():
-        pytest.skip(
-            "Mutation e2e disabled; set STARS_API_TOKEN and STARS_E2E_MUTATE=1 to run"
-        )
-
-
-def require_token_or_skip():
-    """Skip test if STARS_API_TOKEN is not present (used for read-only flows)."""
-    if not os.getenv("STARS_API_TOKEN"):
-        pytest.skip("STARS_API_TOKEN not set; skipping integration test")
+# Evaluated once at import so tests can be skipped at collection time, before
+# any coroutine is scheduled.
+requires_token = pytest.mark.skipif(
+    not os.getenv("STARS_API_TOKEN"),
+    reason="STARS_API_TOKEN not set; skipping integration test",
+)
+requires_mutations = pytest.mark.skipif(
+    should_skip_mutations(),
+    reason="Mutation e2e disabled; set STARS_API_TOKEN and STARS_E2E_MUTATE=1 to run",
+)
 
 
 def get_test_client():
@@ -47,6 +45,14 @@ def get_current_iso_datetime():
     return datetime.now(UTC).isoformat()
 
 
+def get_nominee(result):
+    """Return data.loggedUser.nominee from a get_user_data result, or None."""
+    try:
+        return result["data"]["loggedUser"]["nominee"]
+    except (AttributeError, KeyError, TypeError):
+        return None
+
+
 def assert_cleanup_success(result, resource_type, resource_id):
     """Assert that cleanup was successful, fail if not."""
     if not result.get("ok"):
@@ -1,49 +1,41 @@
 """Integration tests for profile end-to-end."""
 
-import time
+import logging
 
 import pytest
 
-from .test_integration_utils import get_test_client, skip_if_no_mutations
+from .test_integration_utils import get_nominee, requires_mutations
 
+logger = logging.getLogger(__name__)
 
-@pytest.mark.asyncio
-@pytest.mark.client
-async def test_integration_update_profile_e2e():
-    skip_if_no_mutations()
-
-    client = get_test_client()
 
+@pytest.mark.client
+@requires_mutations
+async def test_integration_update_profile_e2e(stars_client, bio_nonce):
     # Get current profile data
-    user_data = await client.get_user_data()
+    user_data = await stars_client.get_user_data()
     assert user_data.get("ok") is True
     logged_user = user_data.get("data", {}).get("loggedUser")
     if not logged_user:
         pytest.skip(
             "Token not valid for reading user data or loggedUser is null; skipping profile update e2e test"
         )
-    nominee = logged_user.get("nominee", {})
+    nominee = get_nominee(user_data)
     original_bio = nominee.get("bio") if nominee else None
 
     # Update bio to a test value
-    test_bio = f"E2E Test Bio {int(time.time())}"
-    update_result = await client.update_profile({"bio": test_bio})
+    test_bio = f"E2E Test Bio {bio_nonce}"
+    update_result = await stars_client.update_profile({"bio": test_bio})
     assert update_result.get("ok") is True
-    print(f"Updated profile bio to '{test_bio}'")
-
-    # Verify update
-    updated_data = await client.get_user_data()
-    assert updated_data.get("ok") is True
-    updated_nominee = (
-        updated_data.get("data", {}).get("loggedUser", {}).get("nominee", {})
-    )
-    assert updated_nominee.get("bio") == test_bio
+    # The mutation echoes the updated bio; no follow-up read needed
+    assert update_result.data["updateProfile"]["bio"] == test_bio
+    logger.info("Updated profile bio to '%s'", test_bio)
 
     # Revert bio to original
     revert_data = {"bio": original_bio} if original_bio is not None else {}
     if original_bio is None:
         revert_data = {"bio": ""}  # Assuming empty if was None
-    revert_result = await client.update_profile(revert_data)
+    revert_result = await stars_client.update_profile(revert_data)
     if not revert_result.get("ok"):
         pytest.fail(f"Failed to revert profile bio: {revert_result.get('error')}")
-    print(f"Reverted profile bio to original: '{original_bio}'")
+    logger.info("Reverted profile bio to original: '%s'", original_bio)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
-from github_stars_contrib_mcp import shared
 from github_stars_contrib_mcp.tools.create_contributions import (
     create_contributions_impl,
 )
@@ -12,51 +13,46 @@ from github_stars_contrib_mcp.tools.delete_contributions import delete_contribut
 from github_stars_contrib_mcp.tools.update_contributions import update_contribution_impl
 
 from .test_integration_utils import (
-    generate_unique_url,
-    get_current_iso_datetime,
-    get_test_client,
-    require_token_or_skip,
-    should_skip_mutations,
+    requires_mutations,
 )
 
 
-@pytest.mark.asyncio
 @pytest.mark.tools
-async def test_tools_contributions_e2e():
-    require_token_or_skip()
-    if should_skip_mutations():
-        pytest.skip(
-            "Mutation e2e disabled; set STARS_API_TOKEN and STARS_E2E_MUTATE=1 to run"
-        )
-
-    client = get_test_client()
-    shared.stars_client = client
-    try:
-        now_iso = get_current_iso_datetime()
-        url = generate_unique_url("github-stars-mcp-tools-contrib")
-        base_payload = {
-            "title": "E2E Tools Contribution",
-            "url": url,
+@requires_mutations
+@pytest.mark.usefixtures("wire_shared")
+async def test_tools_contributions_e2e(unique_url, now_iso):
+    payloads = [
+        {
+            "title": f"E2E Tools Contribution ({ctype})",
+            "url": f"{unique_url}/{ctype.lower()}",
             "description": "Automated tools e2e test; safe to ignore",
-            "type": "BLOGPOST",
+            "type": ctype,
             "date": now_iso,
         }
+        for ctype in ("BLOGPOST", "ARTICLE_PUBLICATION")
+    ]
 
-        # Create
-        create_res = await create_contributions_impl([base_payload])
+    contrib_ids: list[str] = []
+    try:
+        # Create all payloads in a single createContributions request
+        create_res = await create_contributions_impl(payloads)
         assert create_res["success"] is True
-        contrib_id = (create_res.get("ids") or [None])[0]
-        assert contrib_id
-
-        # Update (API expects non-null description, etc.)
-        upd_payload = {**base_payload, "title": "E2E Tools Contribution (updated)"}
-        upd_res = await update_contribution_impl(
-            contribution_id=contrib_id, data=upd_payload
+        contrib_ids = create_res.get("ids") or []
+        assert len(contrib_ids) == len(payloads)
+
+        # Update each entity concurrently (API expects non-null description, etc.)
+        upd_results = await asyncio.gather(
+            *(
+                update_contribution_impl(
+                    contribution_id=cid, data={**p, "title": p["title"] + " (updated)"}
+                )
+                for cid, p in zip(contrib_ids, payloads, strict=True)
+            )
         )
-        assert upd_res["success"] is True
-
-        # Delete
-        del_res = await delete_contribution_impl(contrib_id)
-        assert del_res["success"] is True
+        assert all(r["success"] is True for r in upd_results)
     finally:
-        shared.stars_client = None
+        # Delete concurrently, even when a step above failed, so no test data leaks
+        del_results = await asyncio.gather(
+            *(delete_contribution_impl(cid) for cid in contrib_ids)
+        )
+    assert all(r["success"] is True for r in del_results)
@@ -2,49 +2,53 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
-from github_stars_contrib_mcp import shared
 from github_stars_contrib_mcp.tools.create_link import create_link_impl
 from github_stars_contrib_mcp.tools.delete_link import delete_link_impl
 from github_stars_contrib_mcp.tools.update_link import update_link_impl
 
 from .test_integration_utils import (
-    generate_unique_url,
-    get_test_client,
-    require_token_or_skip,
-    should_skip_mutations,
+    requires_mutations,
 )
 
 
-@pytest.mark.asyncio
 @pytest.mark.tools
-async def test_tools_links_e2e():
-    require_token_or_skip()
-    if should_skip_mutations():
-        pytest.skip(
-            "Mutation e2e disabled; set STARS_API_TOKEN and STARS_E2E_MUTATE=1 to run"
-        )
+@requires_mutations
+@pytest.mark.usefixtures("wire_shared")
+async def test_tools_links_e2e(unique_url):
+    urls = [f"{unique_url}/{n}" for n in range(2)]
 
-    client = get_test_client()
-    shared.stars_client = client
+    link_ids: list[str] = []
     try:
-        url = generate_unique_url("github-stars-mcp-tools-link")
-
-        # Create (use OTHER which is accepted by API)
-        create_res = await create_link_impl(link=url, platform="OTHER")
-        assert create_res["success"] is True
-        link_id = (create_res.get("data") or {}).get("createLink", {}).get("id")
-        assert link_id
+        # Create (use OTHER which is accepted by API); links are independent so
+        # the per-entity create -> update -> delete steps run concurrently
+        create_results = await asyncio.gather(
+            *(create_link_impl(link=url, platform="OTHER") for url in urls)
+        )
+        link_ids = [
+            (r.get("data") or {}).get("createLink", {}).get("id")
+            for r in create_results
+        ]
+        assert all(r["success"] is True for r in create_results)
+        assert all(link_ids)
 
         # Update (platform is non-null in response; pass it to ensure it remains set)
-        upd_res = await update_link_impl(
-            link_id=link_id, data={"link": url + "/updated", "platform": "OTHER"}
+        upd_results = await asyncio.gather(
+            *(
+                update_link_impl(
+                    link_id=link_id,
+                    data={"link": url + "/updated", "platform": "OTHER"},
+                )
+                for link_id, url in zip(link_ids, urls, strict=True)
+            )
         )
-        assert upd_res["success"] is True
-
-        # Delete
-        del_res = await delete_link_impl(link_id=link_id)
-        assert del_res["success"] is True
+        assert all(r["success"] is True for r in upd_results)
     finally:
-        shared.stars_client = None
+        # Delete whatever was created, even when a step above failed
+        del_results = await asyncio.gather(
+            *(delete_link_impl(link_id=link_id) for link_id in link_ids if link_id)
+        )
+    assert all(r["success"] is True for r in del_results)
@@ -8,14 +8,12 @@ class FakePort:
         return {"publicProfile": {"username": username}}
 
 
-@pytest.mark.asyncio
 async def test_get_stars_happy_path():
     use_case = GetStars(FakePort())
     data = await use_case("alice")
     assert data["publicProfile"]["username"] == "alice"
 
 
-@pytest.mark.asyncio
 async def test_get_stars_validates_username():
     use_case = GetStars(FakePort())
     with pytest.raises(ValueError):
@@ -13,14 +13,12 @@ class FailingPort:
         raise RuntimeError("boom")
 
 
-@pytest.mark.asyncio
 async def test_get_user_data_happy_path():
     use_case = GetUserData(FakePort())
     result = await use_case()
     assert result["viewer"]["login"] == "alice"
 
 
-@pytest.mark.asyncio
 async def test_get_user_data_error_bubbles():
     use_case = GetUserData(FailingPort())
     with pytest.raises(RuntimeError, match="boom"):
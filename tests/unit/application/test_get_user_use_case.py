@@ -13,14 +13,12 @@ class FailingPort:
         raise RuntimeError("boom")
 
 
-@pytest.mark.asyncio
 async def test_get_user_happy_path():
     use_case = GetUser(FakePort())
     data = await use_case()
     assert data["loggedUser"]["id"] == "u1"
 
 
-@pytest.mark.asyncio
 async def test_get_user_error_bubbles():
     use_case = GetUser(FailingPort())
     with pytest.raises(RuntimeError, match="boom"):
@@ -0,0 +1,91 @@
+"""Unit-level pytest fixtures."""
+
+from collections.abc import AsyncIterator, Callable
+from types import ModuleType
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from github_stars_contrib_mcp.utils.stars_client import StarsClient
+
+
+class FakeStarsAPI:
+    """StarsAPIPort stand-in that answers each method from a canned response.
+
+    A response may be a plain value (returned as-is), an exception instance
+    (raised), or a callable (invoked with the call's arguments).
+    """
+
+    def __init__(self, responses: dict[str, Any]):
+        self._responses = responses
+
+    def __getattr__(self, name: str):
+        try:
+            response = self._responses[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+        async def _call(*args, **kwargs):
+            if isinstance(response, BaseException):
+                raise response
+            if callable(response):
+                return response(*args, **kwargs)
+            return response
+
+        return _call
+
+
+@pytest.fixture(autouse=True)
+def _no_retry_backoff(monkeypatch) -> AsyncMock:
+    """Make tenacity's backoff between _execute_graphql attempts instantaneous."""
+    sleep = AsyncMock()
+    monkeypatch.setattr(StarsClient._execute_graphql.retry, "sleep", sleep)
+    return sleep
+
+
+@pytest.fixture(scope="session")
+def _stars_client_session() -> StarsClient:
+    return StarsClient("https://api.example.com", "token")
+
+
+@pytest.fixture
+async def stars_client(_stars_client_session) -> AsyncIterator[StarsClient]:
+    """StarsClient pointed at a placeholder URL; shared, so tests must not mutate it.
+
+    Its pooled HTTP client is closed after each test so the next test's httpx
+    patch applies to a fresh one.
+    """
+    yield _stars_client_session
+    await _stars_client_session.aclose()
+
+
+@pytest.fixture
+def fake_stars_api(monkeypatch) -> Callable[..., FakeStarsAPI]:
+    """Patch a tool module's get_stars_api with a FakeStarsAPI.
+
+    Usage: ``fake_stars_api(tool, create_link={"createLink": {...}})``.
+    """
+
+    def _install(tool_module: ModuleType, **responses: Any) -> FakeStarsAPI:
+        port = FakeStarsAPI(responses)
+        monkeypatch.setattr(tool_module, "get_stars_api", lambda: port)
+        return port
+
+    return _install
+
+
+@pytest.fixture
+def async_return() -> Callable[[Any], Callable[..., Any]]:
+    """Build a plain coroutine function that always returns ``value``.
+
+    Cheaper than AsyncMock for stubs whose calls are never asserted on.
+    """
+
+    def _factory(value: Any) -> Callable[..., Any]:
+        async def _coro(*args, **kwargs):
+            return value
+
+        return _coro
+
+    return _factory
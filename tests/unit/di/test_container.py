@@ -1,31 +1,58 @@
+import pytest
+
 from github_stars_contrib_mcp.di.container import (
+    aclose_stars_clients,
     get_settings,
     get_stars_api,
     get_stars_client,
 )
 
 
-def test_settings_reads_environment(monkeypatch):
+@pytest.fixture(autouse=True)
+def _stars_env(monkeypatch):
     monkeypatch.setenv("STARS_API_URL", "http://localhost/api")
     monkeypatch.setenv("STARS_API_TOKEN", "token123")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def test_settings_reads_environment():
     settings = get_settings()
     assert settings.stars_api_url == "http://localhost/api"
     assert settings.stars_api_token == "token123"
 
 
-def test_client_built_from_settings(monkeypatch):
-    monkeypatch.setenv("STARS_API_URL", "http://localhost/api")
-    monkeypatch.setenv("STARS_API_TOKEN", "token123")
+def test_settings_are_cached():
+    assert get_settings() is get_settings()
+
+
+def test_client_built_from_settings():
     settings = get_settings()
     client = get_stars_client(settings)
     assert client.api_url == "http://localhost/api/"
     assert client.token == "token123"
 
 
-def test_stars_api_adapter_is_constructed(monkeypatch):
-    monkeypatch.setenv("STARS_API_URL", "http://localhost/api")
-    monkeypatch.setenv("STARS_API_TOKEN", "token123")
+def test_client_reused_for_same_settings():
+    settings = get_settings()
+    assert get_stars_client(settings) is get_stars_client()
+
+
+def test_stars_api_adapter_is_constructed():
     settings = get_settings()
     adapter = get_stars_api(settings)
     # It should expose an async get_user_data method
     assert hasattr(adapter, "get_user_data")
+
+
+def test_stars_api_reused_for_same_settings():
+    assert get_stars_api(get_settings()) is get_stars_api()
+
+
+async def test_aclose_stars_clients_closes_cached_pools():
+    client = get_stars_client()
+    pool = await client._get_http_client()
+    await aclose_stars_clients()
+    assert pool.is_closed
+    assert get_stars_client() is client
@@ -1,16 +1,20 @@
 """Unit tests for config module."""
 
-from unittest.mock import patch
-
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from github_stars_contrib_mcp.config import Settings
 
+# Validates field values without loading env/.env sources; for tests that only
+# exercise field validators.
+_SETTINGS_ADAPTER = TypeAdapter(Settings)
+
 
 class TestSettings:
-    @patch.dict("os.environ", {}, clear=True)
-    def test_default_settings(self):
+    def test_default_settings(self, monkeypatch):
+        for var in ("STARS_API_TOKEN", "LOG_LEVEL", "DANGEROUSLY_OMIT_AUTH"):
+            monkeypatch.delenv(var, raising=False)
+        # Env cleared above, so these are the declared defaults as loaded by Settings
         settings = Settings()
         assert settings.stars_api_token is None
         assert settings.log_level == "INFO"
@@ -18,16 +22,16 @@ class TestSettings:
 
     @pytest.mark.parametrize("level", ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
     def test_valid_log_levels(self, level):
-        settings = Settings(log_level=level)
+        settings = _SETTINGS_ADAPTER.validate_python({"log_level": level})
         assert settings.log_level == level
 
     def test_log_level_normalization(self):
-        settings = Settings(log_level="debug")
+        settings = _SETTINGS_ADAPTER.validate_python({"log_level": "debug"})
         assert settings.log_level == "DEBUG"
 
     def test_invalid_log_level(self):
         with pytest.raises(ValidationError):
-            Settings(log_level="INVALID")
+            _SETTINGS_ADAPTER.validate_python({"log_level": "INVALID"})
 
     def test_with_token(self):
         settings = Settings(
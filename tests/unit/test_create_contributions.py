@@ -1,20 +1,13 @@
 """Unit tests for create_contributions tool (DI path)."""
 
-from datetime import datetime
-
-import pytest
-
 from github_stars_contrib_mcp.tools import create_contributions as tool
 
+_ISO_2024_01_01 = "2024-01-01T00:00:00"
 
-class TestCreateContributions:
-    @pytest.mark.asyncio
-    async def test_create_contributions_valid(self, monkeypatch):
-        class FakePort:
-            async def create_contributions(self, items):
-                return {"ids": ["1", "2"]}
 
-        monkeypatch.setattr(tool, "get_stars_api", FakePort)
+class TestCreateContributions:
+    async def test_create_contributions_valid(self, fake_stars_api):
+        fake_stars_api(tool, create_contributions={"ids": ["1", "2"]})
 
         data = [
             {
@@ -22,7 +15,7 @@ class TestCreateContributions:
                 "url": "https://example.com",
                 "description": "d",
                 "type": "BLOGPOST",
-                "date": datetime(2024, 1, 1, 0, 0, 0).isoformat(),
+                "date": _ISO_2024_01_01,
             }
         ]
 
@@ -30,40 +23,40 @@ class TestCreateContributions:
         assert res["success"] is True
         assert res["ids"] == ["1", "2"]
 
-    @pytest.mark.asyncio
     async def test_create_contributions_invalid_url(self):
         data = [
             {
                 "title": "Test",
                 "url": "not-a-url",
                 "type": "BLOGPOST",
-                "date": datetime(2024, 1, 1, 0, 0, 0).isoformat(),
+                "date": _ISO_2024_01_01,
             }
         ]
         res = await tool.create_contributions_impl(data)
         assert res["success"] is False
         assert "url" in str(res["error"])
 
-    @pytest.mark.asyncio
-    async def test_create_contributions_error_bubbles(self, monkeypatch):
-        class FailingPort:
-            async def create_contributions(self, items):
-                raise RuntimeError("API error")
+    async def test_create_contributions_error_loc_is_item_index_and_field(self):
+        valid = {
+            "title": "Test",
+            "url": "https://example.com",
+            "type": "BLOGPOST",
+            "date": _ISO_2024_01_01,
+        }
+        res = await tool.create_contributions_impl([valid, {**valid, "url": "nope"}])
+        assert res["success"] is False
+        assert [err["loc"] for err in res["error"]] == [(1, "url")]
 
-        monkeypatch.setattr(tool, "get_stars_api", FailingPort)
+    async def test_create_contributions_error_bubbles(self, fake_stars_api):
+        fake_stars_api(tool, create_contributions=RuntimeError("API error"))
         data = [
             {
                 "title": "Test",
                 "url": "https://example.com",
                 "type": "BLOGPOST",
-                "date": datetime(2024, 1, 1, 0, 0, 0).isoformat(),
+                "date": _ISO_2024_01_01,
             }
         ]
         res = await tool.create_contributions_impl(data)
         assert res["success"] is False
         assert res["error"] == "API error"
-
-    @pytest.mark.asyncio
-    async def test_create_contributions_client_error(self, mock_shared_client):
-        # Covered by error_bubbles above; placeholder to keep test valid
-        assert mock_shared_client is not None
@@ -1,81 +1,32 @@
 """Unit tests for delete_contributions tool (DI path)."""
 
-import pytest
-
 from github_stars_contrib_mcp.tools import delete_contributions as tool
 
 
 class TestDeleteContributions:
-    @pytest.mark.asyncio
-    async def test_delete_contribution_success(self, monkeypatch):
-        class FakePort:
-            async def delete_contribution(self, contribution_id: str):
-                return {"deleteContribution": {"id": contribution_id}}
-
-        monkeypatch.setattr(tool, "get_stars_api", FakePort)
+    async def test_delete_contribution_success(self, fake_stars_api):
+        fake_stars_api(
+            tool,
+            delete_contribution=lambda contribution_id: {
+                "deleteContribution": {"id": contribution_id}
+            },
+        )
         res = await tool.delete_contribution_impl("c1")
         assert res["success"] is True
         assert res["data"] == {"deleteContribution": {"id": "c1"}}
 
-    @pytest.mark.asyncio
-    async def test_delete_contribution_error_bubbles(self, monkeypatch):
-        class FailingPort:
-            async def delete_contribution(self, contribution_id: str):
-                raise RuntimeError("Invalid ID")
-
-        monkeypatch.setattr(tool, "get_stars_api", FailingPort)
+    async def test_delete_contribution_error_bubbles(self, fake_stars_api):
+        fake_stars_api(tool, delete_contribution=RuntimeError("Invalid ID"))
         res = await tool.delete_contribution_impl("invalid")
         assert res["success"] is False
         assert res["error"] == "Invalid ID"
 
-    @pytest.mark.asyncio
-    async def test_delete_contribution_validates_logger(self):
-        # Keep logger coverage check
-        from github_stars_contrib_mcp.tools.delete_contributions import logger
-
-        assert logger is not None
-
-    @pytest.mark.asyncio
-    async def test_delete_contribution_client_error_placeholder(
-        self, mock_shared_client
-    ):
-        # Client error path covered by error_bubbles; placeholder to keep test valid
-        assert mock_shared_client is not None
-
-    @pytest.mark.asyncio
-    async def test_delete_contribution_validation_error_logs(self, caplog, monkeypatch):
-        """Test that validation errors are logged."""
-        # This test ensures the logger is used when ValidationError occurs
-        # Since ValidationError is caught and returned, we need to ensure logger is initialized
-        from github_stars_contrib_mcp.tools.delete_contributions import logger
-
-        # The logger should be initialized
-        assert logger is not None
-
-        # Test with valid input to ensure no validation error
-        class FakePort:
-            async def delete_contribution(self, contribution_id: str):
-                return {"deleteContribution": {"id": contribution_id}}
-
-        monkeypatch.setattr(tool, "get_stars_api", FakePort)
-        res = await tool.delete_contribution_impl("c1")
-        assert res["success"] is True
-
-    @pytest.mark.asyncio
-    async def test_delete_contribution_validation_error_with_logger(self, caplog):
-        """Test that validation errors trigger proper error handling and logger is initialized."""
-        # Force a validation error by passing invalid data
-        # Since the function expects a string ID, we'll test the validation indirectly
+    def test_delete_contribution_logger_initialized(self):
         from github_stars_contrib_mcp.tools.delete_contributions import logger
 
-        # Ensure logger is initialized (this covers lines 22-23)
         assert logger is not None
-        assert hasattr(logger, "info")  # Basic logger check
+        assert hasattr(logger, "info")
 
-        # Minimal assertion to keep the test valid and cover logger presence
-        assert True
-
-    @pytest.mark.asyncio
     async def test_delete_contribution_validation_error_branch(self):
         # Passing None should fail pydantic validation for id: str
         res = await tool.delete_contribution_impl(None)  # type: ignore[arg-type]
@@ -83,13 +34,8 @@ class TestDeleteContributions:
         # Pydantic v2 .errors() returns a list of errors
         assert isinstance(res["error"], list)
 
-    @pytest.mark.asyncio
-    async def test_delete_contribution_exception_branch(self, monkeypatch):
-        class BoomPort:
-            async def delete_contribution(self, contribution_id: str):
-                raise Exception("boom")
-
-        monkeypatch.setattr(tool, "get_stars_api", BoomPort)
+    async def test_delete_contribution_exception_branch(self, fake_stars_api):
+        fake_stars_api(tool, delete_contribution=Exception("boom"))
         res = await tool.delete_contribution_impl("c-err")
         assert res["success"] is False
         assert "boom" in res["error"]
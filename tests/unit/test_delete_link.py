@@ -1,91 +1,37 @@
 """Unit tests for delete_link tool (DI path)."""
 
-import pytest
-
 from github_stars_contrib_mcp.tools import delete_link as tool
 
 
 class TestDeleteLink:
-    @pytest.mark.asyncio
-    async def test_delete_link_success(self, monkeypatch):
-        class FakePort:
-            async def delete_link(self, link_id: str):
-                return {"deleteLink": {"id": link_id}}
-
-        monkeypatch.setattr(tool, "get_stars_api", FakePort)
+    async def test_delete_link_success(self, fake_stars_api):
+        fake_stars_api(
+            tool, delete_link=lambda link_id: {"deleteLink": {"id": link_id}}
+        )
         res = await tool.delete_link_impl("l1")
         assert res["success"] is True
         assert res["data"] == {"deleteLink": {"id": "l1"}}
 
-    @pytest.mark.asyncio
-    async def test_delete_link_error_bubbles(self, monkeypatch):
-        class FailingPort:
-            async def delete_link(self, link_id: str):
-                raise RuntimeError("Invalid ID")
-
-        monkeypatch.setattr(tool, "get_stars_api", FailingPort)
+    async def test_delete_link_error_bubbles(self, fake_stars_api):
+        fake_stars_api(tool, delete_link=RuntimeError("Invalid ID"))
         res = await tool.delete_link_impl("invalid")
         assert res["success"] is False
         assert res["error"] == "Invalid ID"
 
-    @pytest.mark.asyncio
-    async def test_delete_link_logger_initialized(self):
-        from github_stars_contrib_mcp.tools.delete_link import logger
-
-        assert logger is not None
-
-    @pytest.mark.asyncio
-    async def test_delete_link_client_error_placeholder(self, mock_shared_client):
-        # Client error covered by error_bubbles; placeholder to keep test valid
-        assert mock_shared_client is not None
-
-    @pytest.mark.asyncio
-    async def test_delete_link_validation_error_logs(self, caplog, monkeypatch):
-        """Test that validation errors are logged."""
-        # This test ensures the logger is used when ValidationError occurs
-        # Since ValidationError is caught and returned, we need to ensure logger is initialized
-        from github_stars_contrib_mcp.tools.delete_link import logger
-
-        # The logger should be initialized
-        assert logger is not None
-
-        # Test with valid input to ensure no validation error
-        class FakePort:
-            async def delete_link(self, link_id: str):
-                return {"deleteLink": {"id": link_id}}
-
-        monkeypatch.setattr(tool, "get_stars_api", FakePort)
-        res = await tool.delete_link_impl("l1")
-        assert res["success"] is True
-
-    @pytest.mark.asyncio
-    async def test_delete_link_validation_error_with_logger(self, caplog):
-        """Test that validation errors trigger proper error handling and logger is initialized."""
-        # Force a validation error by passing invalid data
-        # Since the function expects a string ID, we'll test the validation indirectly
+    def test_delete_link_logger_initialized(self):
         from github_stars_contrib_mcp.tools.delete_link import logger
 
-        # Ensure logger is initialized (this covers lines 22-23)
         assert logger is not None
-        assert hasattr(logger, "info")  # Basic logger check
+        assert hasattr(logger, "info")
 
-        # Minimal assertion to keep the test valid and cover logger presence
-        assert True
-
-    @pytest.mark.asyncio
     async def test_delete_link_validation_error_branch(self):
         # Passing None should fail pydantic validation for id: str
         res = await tool.delete_link_impl(None)  # type: ignore[arg-type]
         assert res["success"] is False
         assert isinstance(res["error"], list)
 
-    @pytest.mark.asyncio
-    async def test_delete_link_exception_branch(self, monkeypatch):
-        class BoomPort:
-            async def delete_link(self, link_id: str):
-                raise Exception("boom")
-
-        monkeypatch.setattr(tool, "get_stars_api", BoomPort)
+    async def test_delete_link_exception_branch(self, fake_stars_api):
+        fake_stars_api(tool, delete_link=Exception("boom"))
         res = await tool.delete_link_impl("l-err")
         assert res["success"] is False
         assert "boom" in res["error"]
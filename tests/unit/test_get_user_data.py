@@ -1,35 +1,37 @@
 """Unit tests for get_user_data tool."""
 
-from unittest.mock import patch
-
-import pytest
+from types import SimpleNamespace
 
 from github_stars_contrib_mcp import shared
 from github_stars_contrib_mcp.tools.get_user_data import get_user_data_impl
 
 
 class TestGetUserData:
-    @pytest.mark.asyncio
-    async def test_get_user_data_success(self, mock_shared_client):
-        mock_shared_client.get_user_data.return_value = {
+    async def test_get_user_data_success(self, monkeypatch, async_return):
+        response = {
             "ok": True,
             "data": {"loggedUser": {"id": "u1"}},
         }
+        monkeypatch.setattr(
+            shared,
+            "stars_client",
+            SimpleNamespace(get_user_data=async_return(response)),
+        )
 
         res = await get_user_data_impl()
         assert res["success"] is True
         assert res["data"]["loggedUser"]["id"] == "u1"
 
-    @pytest.mark.asyncio
-    async def test_get_user_data_not_initialized(self):
-        with patch.object(shared, "stars_client", None):
-            res = await get_user_data_impl()
-            assert res["success"] is False
-            assert res["data"] is None
+    async def test_get_user_data_not_initialized(self, monkeypatch):
+        monkeypatch.setattr(shared, "stars_client", None)
+        res = await get_user_data_impl()
+        assert res["success"] is False
+        assert res["data"] is None
 
-    @pytest.mark.asyncio
-    async def test_get_user_data_includes_contributions(self, mock_shared_client):
-        mock_shared_client.get_user_data.return_value = {
+    async def test_get_user_data_includes_contributions(
+        self, monkeypatch, async_return
+    ):
+        response = {
             "ok": True,
             "data": {
                 "loggedUser": {
@@ -57,6 +59,11 @@ class TestGetUserData:
                 }
             },
         }
+        monkeypatch.setattr(
+            shared,
+            "stars_client",
+            SimpleNamespace(get_user_data=async_return(response)),
+        )
 
         res = await get_user_data_impl()
         assert res["success"] is True
@@ -64,36 +71,48 @@ class TestGetUserData:
         assert isinstance(contribs, list) and len(contribs) == 2
         assert {c["id"] for c in contribs} == {"c1", "c2"}
 
-    @pytest.mark.asyncio
-    async def test_get_user_data_no_nominee_ok(self, mock_shared_client):
-        mock_shared_client.get_user_data.return_value = {
+    async def test_get_user_data_no_nominee_ok(self, monkeypatch, async_return):
+        response = {
             "ok": True,
             "data": {"loggedUser": {"id": "u1", "nominee": None}},
         }
+        monkeypatch.setattr(
+            shared,
+            "stars_client",
+            SimpleNamespace(get_user_data=async_return(response)),
+        )
 
         res = await get_user_data_impl()
         assert res["success"] is True
         assert res["data"]["loggedUser"]["nominee"] is None
 
-    @pytest.mark.asyncio
-    async def test_get_user_data_client_error(self, mock_shared_client):
-        mock_shared_client.get_user_data.return_value = {
+    async def test_get_user_data_client_error(self, monkeypatch, async_return):
+        response = {
             "ok": False,
             "error": "API error",
             "data": None,
         }
+        monkeypatch.setattr(
+            shared,
+            "stars_client",
+            SimpleNamespace(get_user_data=async_return(response)),
+        )
 
         res = await get_user_data_impl()
         assert res["success"] is False
         assert res["error"] == "API error"
         assert res["data"] is None
 
-    @pytest.mark.asyncio
-    async def test_get_user_data_logged_user_null(self, mock_shared_client):
-        mock_shared_client.get_user_data.return_value = {
+    async def test_get_user_data_logged_user_null(self, monkeypatch, async_return):
+        response = {
             "ok": True,
             "data": {"loggedUser": None},
         }
+        monkeypatch.setattr(
+            shared,
+            "stars_client",
+            SimpleNamespace(get_user_data=async_return(response)),
+        )
 
         res = await get_user_data_impl()
         assert res["success"] is True
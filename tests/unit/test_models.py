@@ -14,23 +14,33 @@ from github_stars_contrib_mcp.models import (
 )
 
 
+@pytest.fixture(scope="module")
+def valid_item_kwargs():
+    """Canonical minimal ContributionItem payload; copy before overriding fields."""
+    return {
+        "title": "Test",
+        "url": "https://example.com",
+        "type": ContributionType.BLOGPOST,
+        "date": datetime(2024, 1, 1),
+    }
+
+
 class TestContributionType:
-    @pytest.mark.parametrize(
-        "contribution_type",
-        [
-            "BLOGPOST",
-            "SPEAKING",
-            "ARTICLE_PUBLICATION",
-            "EVENT_ORGANIZATION",
-            "HACKATHON",
-            "OPEN_SOURCE_PROJECT",
-            "VIDEO_PODCAST",
-            "FORUM",
-            "OTHER",
-        ],
+    VALID = (
+        "BLOGPOST",
+        "SPEAKING",
+        "ARTICLE_PUBLICATION",
+        "EVENT_ORGANIZATION",
+        "HACKATHON",
+        "OPEN_SOURCE_PROJECT",
+        "VIDEO_PODCAST",
+        "FORUM",
+        "OTHER",
     )
-    def test_valid_types(self, contribution_type):
-        assert ContributionType(contribution_type) == contribution_type
+
+    def test_valid_types(self):
+        for contribution_type in self.VALID:
+            assert ContributionType(contribution_type) == contribution_type
 
 
 class TestContributionItem:
@@ -48,13 +58,8 @@ class TestContributionItem:
         assert item.type == ContributionType.BLOGPOST
         assert item.date == datetime(2024, 1, 1, 12, 0, 0)
 
-    def test_minimal_item(self):
-        item = ContributionItem(
-            title="Test",
-            url="https://example.com",
-            type=ContributionType.BLOGPOST,
-            date=datetime(2024, 1, 1),
-        )
+    def test_minimal_item(self, valid_item_kwargs):
+        item = ContributionItem(**valid_item_kwargs)
         assert item.description is None
 
     @pytest.mark.parametrize(
@@ -65,23 +70,13 @@ class TestContributionItem:
             "",
         ],
     )
-    def test_invalid_url(self, invalid_url):
+    def test_invalid_url(self, valid_item_kwargs, invalid_url):
         with pytest.raises(ValidationError):
-            ContributionItem(
-                title="Test",
-                url=invalid_url,
-                type=ContributionType.BLOGPOST,
-                date=datetime(2024, 1, 1),
-            )
-
-    def test_invalid_type(self):
+            ContributionItem(**{**valid_item_kwargs, "url": invalid_url})
+
+    def test_invalid_type(self, valid_item_kwargs):
         with pytest.raises(ValidationError):
-            ContributionItem(
-                title="Test",
-                url="https://example.com",
-                type="INVALID",
-                date=datetime(2024, 1, 1),
-            )
+            ContributionItem(**{**valid_item_kwargs, "type": "INVALID"})
 
 
 class TestCreateContributionsResponse:
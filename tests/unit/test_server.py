@@ -1,85 +1,66 @@
 """Unit tests for server module."""
 
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
 
 from github_stars_contrib_mcp import server
 
 
+@pytest.fixture
+def server_env(monkeypatch, async_return):
+    """Swap server's settings, logger, mcp and initializer for cheap stand-ins."""
+    fake_mcp = SimpleNamespace(run=MagicMock())
+    fake_logger = SimpleNamespace(
+        info=MagicMock(), warning=MagicMock(), error=MagicMock()
+    )
+    monkeypatch.setattr(server, "mcp", fake_mcp)
+    monkeypatch.setattr(server, "logger", fake_logger)
+    monkeypatch.setattr(
+        server, "settings", SimpleNamespace(stars_api_token=None, log_level="INFO")
+    )
+    monkeypatch.setattr(server, "initialize_server", async_return(None))
+    for key in ("MCP_HOST", "MCP_PORT", "MCP_PATH", "MCP_TRANSPORT"):
+        monkeypatch.delenv(key, raising=False)
+    return fake_mcp, fake_logger
+
+
 class TestServer:
-    @patch("os.getenv")
-    @patch("github_stars_contrib_mcp.server.mcp")
-    @patch("github_stars_contrib_mcp.server.logger")
-    @patch("github_stars_contrib_mcp.server.settings")
-    def test_main(self, mock_settings, mock_logger, mock_mcp, mock_getenv):
-        mock_settings.stars_api_token = "test_token"
-        mock_settings.log_level = "INFO"
-        mock_getenv.side_effect = lambda key, default=None: {
-            "MCP_HOST": "127.0.0.1",
-            "MCP_PORT": "8766",
-            "MCP_PATH": "/mcp",
-        }.get(key, default)
-
-        with patch(
-            "github_stars_contrib_mcp.server.initialize_server", new_callable=AsyncMock
-        ):
-            server.main()
-
-        mock_logger.info.assert_called_once_with(
+    def test_main(self, server_env, monkeypatch):
+        fake_mcp, fake_logger = server_env
+        monkeypatch.setenv("MCP_HOST", "127.0.0.1")
+        monkeypatch.setenv("MCP_PORT", "8766")
+        monkeypatch.setenv("MCP_PATH", "/mcp")
+
+        server.main()
+
+        fake_logger.info.assert_called_once_with(
             "Starting Stars Contributions MCP Server", log_level="INFO"
         )
-        mock_mcp.run.assert_called_once_with(transport="stdio")
-
-    @patch("os.getenv")
-    @patch("github_stars_contrib_mcp.server.mcp")
-    @patch("github_stars_contrib_mcp.server.logger")
-    @patch("github_stars_contrib_mcp.server.settings")
-    def test_main_http_transport(
-        self, mock_settings, mock_logger, mock_mcp, mock_getenv
-    ):
-        mock_settings.stars_api_token = None
-        mock_settings.log_level = "INFO"
-
-        # Force HTTP transport branch and allow startup without token
-        def getenv_side(key, default=None):
-            values = {
-                "MCP_HOST": "0.0.0.0",
-                "MCP_PORT": "9999",
-                "MCP_PATH": "/mcp",
-                "MCP_TRANSPORT": "http",
-                "DANGEROUSLY_OMIT_AUTH": "true",
-            }
-            return values.get(key, default)
-
-        mock_getenv.side_effect = getenv_side
-
-        # Avoid actually initializing network clients
-        from github_stars_contrib_mcp import server as server_mod
-
-        with patch.object(server_mod, "initialize_server", new_callable=AsyncMock):
-            server_mod.main()
-
-        mock_mcp.run.assert_called_once_with(
-            transport="http", host="0.0.0.0", port=9999, path="/mcp"
-        )
+        fake_mcp.run.assert_called_once_with(transport="stdio")
+
+    def test_main_http_transport(self, server_env, monkeypatch):
+        fake_mcp, _ = server_env
+        monkeypatch.setenv("MCP_HOST", "0.0.0.0")
+        monkeypatch.setenv("MCP_PORT", "9999")
+        monkeypatch.setenv("MCP_PATH", "/mcp")
+        monkeypatch.setenv("MCP_TRANSPORT", "http")
 
-    @patch("os.getenv")
-    @patch("github_stars_contrib_mcp.server.mcp")
-    @patch("github_stars_contrib_mcp.server.logger")
-    @patch("github_stars_contrib_mcp.server.settings")
-    def test_main_initialization_error_exits(
-        self, mock_settings, mock_logger, mock_mcp, mock_getenv
-    ):
-        mock_settings.log_level = "INFO"
-        mock_getenv.side_effect = lambda key, default=None: default
+        server.main()
 
-        from github_stars_contrib_mcp import server as server_mod
+        fake_mcp.run.assert_called_once_with(
+            transport="http", host="0.0.0.0", port=9999, path="/mcp"
+        )
 
+    def test_main_initialization_error_exits(self, server_env, monkeypatch):
         async def failing_init():
             raise RuntimeError("boom")
 
-        with patch.object(
-            server_mod, "initialize_server", new=AsyncMock(side_effect=failing_init)
-        ):
-            with patch("sys.exit") as mock_exit:
-                server_mod.main()
-                mock_exit.assert_called_once_with(1)
+        mock_exit = MagicMock()
+        monkeypatch.setattr(server, "initialize_server", failing_init)
+        monkeypatch.setattr(server.sys, "exit", mock_exit)
+
+        server.main()
+
+        mock_exit.assert_called_once_with(1)
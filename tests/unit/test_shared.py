@@ -1,50 +1,92 @@
 """Unit tests for shared module."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from github_stars_contrib_mcp import shared
+from github_stars_contrib_mcp.utils.models import APIResult
+
+_OK_USER_APIRESULT = APIResult(ok=True, data={"loggedUser": {"id": "test"}})
+_BAD_APIRESULT = APIResult(ok=False, error="bad")
+
+
+@pytest.fixture(autouse=True)
+def _restore_stars_client(monkeypatch):
+    """initialize_stars_client rebinds the module global; undo it after each test."""
+    monkeypatch.setattr(shared, "stars_client", None)
 
 
 @pytest.fixture
-def mock_shared_client():
-    """Fixture to mock the shared client."""
-    with patch("github_stars_contrib_mcp.shared.StarsClient") as mock_client_class:
-        yield mock_client_class
+def shared_env(monkeypatch):
+    """Swap shared.settings and shared.StarsClient for cheap stand-ins."""
+    env = SimpleNamespace(stars_api_token=None, dangerously_omit_auth=False)
+    client_cls = MagicMock()
+    monkeypatch.setattr(shared, "settings", env)
+    monkeypatch.setattr(shared, "StarsClient", client_cls)
+    return env, client_cls
 
 
 class TestShared:
-    @pytest.mark.asyncio
-    async def test_initialize_stars_client_no_token(self, mock_shared_client):
-        with patch("github_stars_contrib_mcp.shared.settings") as mock_settings:
-            mock_settings.stars_api_token = None
-            await shared.initialize_stars_client()
+    @pytest.mark.parametrize(
+        "token, omit, api_result, expect",
+        [
+            pytest.param(None, True, None, "none", id="no-token-auth-omitted"),
+            pytest.param(None, False, None, ValueError, id="no-token-auth-required"),
+            pytest.param("tok", False, _OK_USER_APIRESULT, "set", id="valid-token"),
+            pytest.param("tok", False, _BAD_APIRESULT, ValueError, id="invalid-token"),
+        ],
+    )
+    async def test_initialize_stars_client(
+        self, shared_env, async_return, token, omit, api_result, expect
+    ):
+        env, client_cls = shared_env
+        env.stars_api_token = token
+        env.dangerously_omit_auth = omit
+        client_cls.return_value = SimpleNamespace(
+            get_user_data=async_return(api_result), aclose=AsyncMock()
+        )
+
+        if expect is ValueError:
+            with pytest.raises(ValueError):
+                await shared.initialize_stars_client()
+            if token:
+                client_cls.return_value.aclose.assert_awaited_once()
+            return
+
+        await shared.initialize_stars_client()
+        if expect == "set":
+            assert shared.stars_client is client_cls.return_value
+            client_cls.assert_called_once_with(
+                api_url="https://api-stars.github.com/", token="tok"
+            )
+            # The validation request ran in the start-up loop; its pool is released.
+            client_cls.return_value.aclose.assert_awaited_once()
+        else:
             assert shared.stars_client is None
+            client_cls.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_initialize_stars_client_with_token(self, mock_shared_client):
-        with patch("github_stars_contrib_mcp.shared.settings") as mock_settings:
-            mock_settings.stars_api_token = "test_token"
-            mock_client = AsyncMock()
-            mock_client.get_user_data.return_value = {
-                "ok": True,
-                "data": {"loggedUser": {"id": "test"}},
-            }
-            mock_shared_client.return_value = mock_client
+    async def test_initialize_stars_client_exception(self, shared_env):
+        env, client_cls = shared_env
+        env.stars_api_token = "test_token"
+        client_cls.side_effect = Exception("Test error")
+        with pytest.raises(Exception, match="Test error"):
             await shared.initialize_stars_client()
-            assert shared.stars_client == mock_client
-            mock_shared_client.assert_called_once_with(
-                api_url="https://api-stars.github.com/", token="test_token"
-            )
 
-    @pytest.mark.asyncio
-    async def test_initialize_stars_client_exception(self, mock_shared_client):
-        with patch("github_stars_contrib_mcp.shared.settings") as mock_settings:
-            mock_settings.stars_api_token = "test_token"
-            mock_shared_client.side_effect = Exception("Test error")
-            with pytest.raises(Exception, match="Test error"):
-                await shared.initialize_stars_client()
+    async def test_lifespan_closes_pooled_clients(self, monkeypatch):
+        closers = {name: AsyncMock() for name in ("url_check", "di")}
+        client = SimpleNamespace(aclose=AsyncMock())
+        monkeypatch.setattr(shared, "aclose_url_check_client", closers["url_check"])
+        monkeypatch.setattr(shared, "aclose_stars_clients", closers["di"])
+        monkeypatch.setattr(shared, "stars_client", client)
+
+        async with shared._lifespan(shared.mcp):
+            client.aclose.assert_not_awaited()
+
+        client.aclose.assert_awaited_once()
+        closers["url_check"].assert_awaited_once()
+        closers["di"].assert_awaited_once()
 
     def test_configure_logging(self):
         # Test that _configure_logging sets up logging when not configured
@@ -1,39 +1,15 @@
-import json
-
-import pytest
+from dataclasses import dataclass, field
+from typing import Any
 
 import github_stars_contrib_mcp.utils.stars_client as sc_mod
-from github_stars_contrib_mcp.utils.stars_client import StarsClient
-
-
-class _DummyResp:
-    def __init__(self, status_code=200, data=None, text="{}"):
-        self.status_code = status_code
-        self._data = data if data is not None else {"data": {"ok": True}}
-        self.text = text
-
-    def json(self):
-        return self._data
-
 
-class _DummyClient:
-    def __init__(self, resp: _DummyResp):
-        self._resp = resp
-
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
-
-    async def post(self, url, json=None):  # noqa: A002 - shadowing json param acceptable in test
-        return self._resp
+_API_URL = "https://api.example.com/"
 
 
+@dataclass(slots=True)
 class _LogCapture:
-    def __init__(self):
-        self.infos = []
-        self.warnings = []
+    infos: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+    warnings: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
 
     def info(self, event, **kwargs):
         self.infos.append((event, kwargs))
@@ -42,24 +18,16 @@ class _LogCapture:
         self.warnings.append((event, kwargs))
 
 
-@pytest.mark.asyncio
-async def test_execute_graphql_success_logs_op_and_duration(monkeypatch):
+async def test_execute_graphql_success_logs_op_and_duration(
+    monkeypatch, respx_mock, stars_client
+):
     # Arrange
     log = _LogCapture()
     monkeypatch.setattr(sc_mod, "logger", log)
-    dummy = _DummyResp(
-        status_code=200,
-        data={"data": {"ok": True}},
-        text=json.dumps({"data": {"ok": True}}),
-    )
-    monkeypatch.setattr(
-        sc_mod.httpx, "AsyncClient", lambda **kwargs: _DummyClient(dummy)
-    )
-
-    client = StarsClient(api_url="https://api-stars.local/graphql", token="t")
+    route = respx_mock.post(_API_URL).respond(200, json={"data": {"ok": True}})
 
     # Act
-    res = await client._execute_graphql("query Q{ ok }", op="unitOp")
+    res = await stars_client._execute_graphql("query Q{ ok }", op="unitOp")
 
     # Assert
     assert res["ok"] is True
@@ -69,22 +37,20 @@ async def test_execute_graphql_success_logs_op_and_duration(monkeypatch):
     assert fields.get("op") == "unitOp"
     assert isinstance(fields.get("duration_ms"), int)
     assert fields.get("http_status") == 200
+    assert fields.get("response_bytes") == len(route.calls.last.response.content)
+    assert fields.get("body_bytes") == len(route.calls.last.request.content)
 
 
-@pytest.mark.asyncio
-async def test_execute_graphql_http_error_logs_failed_with_op_and_duration(monkeypatch):
+async def test_execute_graphql_http_error_logs_failed_with_op_and_duration(
+    monkeypatch, respx_mock, stars_client
+):
     # Arrange
     log = _LogCapture()
     monkeypatch.setattr(sc_mod, "logger", log)
-    dummy = _DummyResp(status_code=500, data={"not_json": True}, text="boom")
-    monkeypatch.setattr(
-        sc_mod.httpx, "AsyncClient", lambda **kwargs: _DummyClient(dummy)
-    )
-
-    client = StarsClient(api_url="https://api-stars.local/graphql", token="t")
+    respx_mock.post(_API_URL).respond(500, text="boom")
 
     # Act
-    res = await client._execute_graphql("mutation M{ ok }", op="unitOpErr")
+    res = await stars_client._execute_graphql("mutation M{ ok }", op="unitOpErr")
 
     # Assert
     assert res["ok"] is False
@@ -1,61 +1,89 @@
+import asyncio
+from collections.abc import Callable
+from unittest.mock import AsyncMock
+
 import pytest
 
 from github_stars_contrib_mcp.config.settings import settings
 from github_stars_contrib_mcp.tools import create_contributions as create_contribs_mod
 from github_stars_contrib_mcp.tools import create_link as create_link_mod
 from github_stars_contrib_mcp.tools import update_link as update_link_mod
+from github_stars_contrib_mcp.utils import url_check
 
+_ITEM = {
+    "title": "t",
+    "url": "https://example.com/a",
+    "description": None,
+    "type": "BLOGPOST",
+    "date": "2025-01-01T00:00:00Z",
+}
 
-@pytest.mark.asyncio
-async def test_create_link_rejects_invalid_url(monkeypatch):
-    # Enable validation and force invalid
-    monkeypatch.setattr(settings, "validate_urls", True)
-    monkeypatch.setattr(settings, "url_validation_timeout_s", 1)
 
-    async def _bad(url, timeout_s=None):
-        return (False, "status 404")
+def _items(n: int) -> list[dict]:
+    """``n`` copies of _ITEM with distinct titles and URLs https://example.com/<i>."""
+    return [
+        {**_ITEM, "title": f"t{i}", "url": f"https://example.com/{i}"} for i in range(n)
+    ]
 
-    monkeypatch.setattr(create_link_mod, "check_url_head", _bad)
 
-    res = await create_link_mod.create_link_impl("https://example.com/x", "OTHER")
-    assert res["success"] is False
-    assert "Invalid URL (status 404)" in res["error"]
+@pytest.fixture
+def slow_probe(monkeypatch) -> Callable[..., dict[str, int]]:
+    """Enable URL validation with a check_url_head stub that tracks concurrency.
 
+    Usage: ``state = slow_probe(*bad_urls)``; each probe yields for 10ms, the
+    given URLs fail with "status 404", and ``state["peak"]`` records the most
+    probes seen in flight at once.
+    """
 
-@pytest.mark.asyncio
-async def test_create_link_accepts_valid_url_and_calls_use_case(monkeypatch):
-    monkeypatch.setattr(settings, "validate_urls", True)
+    def _install(*bad_urls: str) -> dict[str, int]:
+        state = {"active": 0, "peak": 0}
 
-    async def _ok(url, timeout_s=None):
-        return (True, None)
+        async def _probe(url, timeout_s=None):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return (False, "status 404") if url in bad_urls else (True, None)
 
-    monkeypatch.setattr(create_link_mod, "check_url_head", _ok)
+        monkeypatch.setattr(settings, "validate_urls", True)
+        monkeypatch.setattr(create_contribs_mod, "check_url_head", _probe)
+        return state
 
-    called = {}
+    return _install
 
-    class FakeUseCase:
-        async def __call__(self, link, platform):
-            called["link"] = link
-            called["platform"] = platform
-            return {"ok": True}
 
-    monkeypatch.setattr(create_link_mod, "CreateLink", lambda *_: FakeUseCase())
-    monkeypatch.setattr(create_link_mod, "get_stars_api", lambda: object())
+async def test_create_link_rejects_invalid_url(monkeypatch, async_return):
+    # Enable validation and force invalid
+    monkeypatch.setattr(settings, "validate_urls", True)
+    monkeypatch.setattr(settings, "url_validation_timeout_s", 1)
+    monkeypatch.setattr(
+        create_link_mod, "check_url_head", async_return((False, "status 404"))
+    )
 
     res = await create_link_mod.create_link_impl("https://example.com/x", "OTHER")
-    assert res["success"] is True
-    assert called["link"] == "https://example.com/x"
-    assert called["platform"] == "OTHER"
+    assert res["success"] is False
+    assert "Invalid URL (status 404)" in res["error"]
 
 
-@pytest.mark.asyncio
-async def test_update_link_rejects_invalid_url(monkeypatch):
+async def test_create_link_accepts_valid_url_and_calls_use_case(
+    monkeypatch, async_return
+):
     monkeypatch.setattr(settings, "validate_urls", True)
+    monkeypatch.setattr(create_link_mod, "check_url_head", async_return((True, None)))
+    use_case = AsyncMock(return_value={"ok": True})
+    monkeypatch.setattr(create_link_mod, "CreateLink", lambda *_: use_case)
+    monkeypatch.setattr(create_link_mod, "get_stars_api", lambda: object())
+
+    res = await create_link_mod.create_link_impl("https://example.com/x", "OTHER")
+    assert res["success"] is True
+    use_case.assert_awaited_once_with("https://example.com/x", "OTHER")
 
-    async def _bad2(url, timeout_s=None):
-        return (False, "timeout")
 
-    monkeypatch.setattr(update_link_mod, "check_url_head", _bad2)
+async def test_update_link_rejects_invalid_url(monkeypatch, async_return):
+    monkeypatch.setattr(settings, "validate_urls", True)
+    monkeypatch.setattr(
+        update_link_mod, "check_url_head", async_return((False, "timeout"))
+    )
 
     res = await update_link_mod.update_link_impl(
         "id1", {"link": "https://example.com/"}
@@ -64,80 +92,126 @@ async def test_update_link_rejects_invalid_url(monkeypatch):
     assert "Invalid URL (timeout) for: https://example.com" in res["error"]
 
 
-@pytest.mark.asyncio
-async def test_update_link_accepts_valid_url_and_strips_trailing_slash(monkeypatch):
+async def test_update_link_accepts_valid_url_and_strips_trailing_slash(
+    monkeypatch, async_return
+):
     monkeypatch.setattr(settings, "validate_urls", True)
-
-    async def _ok2(url, timeout_s=None):
-        return (True, None)
-
-    monkeypatch.setattr(update_link_mod, "check_url_head", _ok2)
-
-    captured = {}
-
-    class FakeUseCase:
-        async def __call__(self, link_id, *, link=None, platform=None):
-            captured["id"] = link_id
-            captured["link"] = link
-            captured["platform"] = platform
-            return {"ok": True}
-
-    monkeypatch.setattr(update_link_mod, "UpdateLink", lambda *_: FakeUseCase())
+    monkeypatch.setattr(update_link_mod, "check_url_head", async_return((True, None)))
+    use_case = AsyncMock(return_value={"ok": True})
+    monkeypatch.setattr(update_link_mod, "UpdateLink", lambda *_: use_case)
     monkeypatch.setattr(update_link_mod, "get_stars_api", lambda: object())
 
     res = await update_link_mod.update_link_impl(
         "id1", {"link": "https://example.com/"}
     )
     assert res["success"] is True
-    assert captured["link"] == "https://example.com"
+    assert use_case.await_args.kwargs["link"] == "https://example.com"
 
 
-@pytest.mark.asyncio
-async def test_create_contributions_validates_urls(monkeypatch):
+async def test_create_contributions_validates_urls(monkeypatch, async_return):
     monkeypatch.setattr(settings, "validate_urls", True)
 
     # Invalid path
-    async def _bad3(url, timeout_s=None):
-        return (False, "error")
-
-    monkeypatch.setattr(create_contribs_mod, "check_url_head", _bad3)
-    res_bad = await create_contribs_mod.create_contributions_impl(
-        [
-            {
-                "title": "t",
-                "url": "https://example.com/a",
-                "description": None,
-                "type": "BLOGPOST",
-                "date": "2025-01-01T00:00:00Z",
-            }
-        ]
+    monkeypatch.setattr(
+        create_contribs_mod, "check_url_head", async_return((False, "error"))
     )
+    res_bad = await create_contribs_mod.create_contributions_impl([_ITEM])
     assert res_bad["success"] is False and "Invalid URL (error)" in res_bad["error"]
 
     # Valid path
-    async def _ok3(url, timeout_s=None):
-        return (True, None)
+    monkeypatch.setattr(
+        create_contribs_mod, "check_url_head", async_return((True, None))
+    )
+    monkeypatch.setattr(
+        create_contribs_mod,
+        "CreateContributions",
+        lambda *_: async_return({"ids": ["1"]}),
+    )
+    monkeypatch.setattr(create_contribs_mod, "get_stars_api", lambda: object())
+
+    res_ok = await create_contribs_mod.create_contributions_impl([_ITEM])
+    assert res_ok["success"] is True and res_ok.get("ids") == ["1"]
+
+
+async def test_create_contributions_validates_urls_concurrently(slow_probe):
+    state = slow_probe("https://example.com/5")
 
-    monkeypatch.setattr(create_contribs_mod, "check_url_head", _ok3)
+    res = await create_contribs_mod.create_contributions_impl(_items(8))
 
-    class FakeUseCase:
-        async def __call__(self, items):
-            return {"ids": ["1"]}
+    assert state["peak"] == 8
+    assert res == {
+        "success": False,
+        "error": "Invalid URL (status 404) for: https://example.com/5",
+    }
+
+
+async def test_create_contributions_url_checks_respect_concurrency(
+    monkeypatch, async_return, slow_probe
+):
+    monkeypatch.setattr(settings, "url_validation_concurrency", 3)
+    state = slow_probe()
+    monkeypatch.setattr(
+        create_contribs_mod,
+        "CreateContributions",
+        lambda *_: async_return({"ids": [str(n) for n in range(8)]}),
+    )
+    monkeypatch.setattr(create_contribs_mod, "get_stars_api", lambda: object())
 
+    res = await create_contribs_mod.create_contributions_impl(_items(8))
+
+    assert res["success"] is True and len(res["ids"]) == 8
+    assert state["peak"] == 3
+
+
+@pytest.fixture
+async def slow_http_server():
+    """Local HTTP server that holds every response for 0.4s; yields its base URL.
+
+    respx intercepts below httpx's connection pool, so pool exhaustion can only
+    be reproduced against a real socket.
+    """
+
+    async def _handle(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        await asyncio.sleep(0.4)
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+        )
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    url_check._client = None
+    try:
+        yield f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    finally:
+        await url_check.aclose_client()
+        server.close()
+        await server.wait_closed()
+
+
+async def test_concurrent_calls_beyond_per_call_concurrency_do_not_time_out(
+    monkeypatch, async_return, slow_http_server
+):
+    # Each call may probe one URL at a time, but four calls run side by side.
+    # Were the shared pool capped at that per-call limit, their probes would
+    # queue for its single connection and the last would wait 1.2s for it,
+    # failing with PoolTimeout (reported as "Invalid URL (timeout)").
+    monkeypatch.setattr(settings, "validate_urls", True)
+    monkeypatch.setattr(settings, "url_validation_concurrency", 1)
+    monkeypatch.setattr(settings, "url_validation_timeout_s", 1)
     monkeypatch.setattr(
-        create_contribs_mod, "CreateContributions", lambda *_: FakeUseCase()
+        create_contribs_mod, "CreateContributions", lambda *_: async_return({"ids": []})
     )
     monkeypatch.setattr(create_contribs_mod, "get_stars_api", lambda: object())
 
-    res_ok = await create_contribs_mod.create_contributions_impl(
-        [
-            {
-                "title": "t",
-                "url": "https://example.com/a",
-                "description": None,
-                "type": "BLOGPOST",
-                "date": "2025-01-01T00:00:00Z",
-            }
-        ]
+    results = await asyncio.gather(
+        *(
+            create_contribs_mod.create_contributions_impl(
+                [{**_ITEM, "url": f"{slow_http_server}/{n}"}]
+            )
+            for n in range(4)
+        )
     )
-    assert res_ok["success"] is True and res_ok.get("ids") == ["1"]
+
+    assert [r["success"] for r in results] == [True] * 4, results
@@ -1,25 +1,21 @@
 """Unit tests for update_contributions tool (DI path)."""
 
-from datetime import datetime
-
-import pytest
-
 from github_stars_contrib_mcp.tools import update_contributions as tool
 
+_ISO_2024_01_01 = "2024-01-01T00:00:00"
+
 
 class TestUpdateContributions:
-    @pytest.mark.asyncio
-    async def test_update_contribution_success(self, monkeypatch):
-        class FakePort:
-            async def update_contribution(self, contribution_id: str, data: dict):
-                return {
-                    "updateContribution": {
-                        "id": contribution_id,
-                        "title": data["title"],
-                    }
+    async def test_update_contribution_success(self, fake_stars_api):
+        fake_stars_api(
+            tool,
+            update_contribution=lambda contribution_id, data: {
+                "updateContribution": {
+                    "id": contribution_id,
+                    "title": data["title"],
                 }
-
-        monkeypatch.setattr(tool, "get_stars_api", FakePort)
+            },
+        )
 
         data = {"title": "Updated Title"}
         res = await tool.update_contribution_impl("c1", data)
@@ -28,53 +24,43 @@ class TestUpdateContributions:
             "updateContribution": {"id": "c1", "title": "Updated Title"}
         }
 
-    @pytest.mark.asyncio
     async def test_update_contribution_invalid_url(self):
         data = {"url": "not-a-url"}
         res = await tool.update_contribution_impl("c1", data)
         assert res["success"] is False
         assert "url" in str(res["error"])
 
-    @pytest.mark.asyncio
     async def test_update_contribution_invalid_date(self):
         data = {"date": "not-a-date"}
         res = await tool.update_contribution_impl("c1", data)
         assert res["success"] is False
         assert "date" in str(res["error"])
 
-    @pytest.mark.asyncio
-    async def test_update_contribution_error_bubbles(self, monkeypatch):
-        class FailingPort:
-            async def update_contribution(self, contribution_id: str, data: dict):
-                raise RuntimeError("API error")
-
-        monkeypatch.setattr(tool, "get_stars_api", FailingPort)
+    async def test_update_contribution_error_bubbles(self, fake_stars_api):
+        fake_stars_api(tool, update_contribution=RuntimeError("API error"))
         data = {"title": "Test"}
         res = await tool.update_contribution_impl("c1", data)
         assert res["success"] is False
         assert res["error"] == "API error"
 
-    @pytest.mark.asyncio
-    async def test_update_contribution_full_update(
-        self, mock_shared_client, monkeypatch
-    ):
-        class FakePort2:
-            async def update_contribution(self, contribution_id: str, data: dict):
-                return {"updateContribution": {"id": contribution_id}}
-
-        monkeypatch.setattr(tool, "get_stars_api", FakePort2)
+    async def test_update_contribution_full_update(self, fake_stars_api):
+        fake_stars_api(
+            tool,
+            update_contribution=lambda contribution_id, data: {
+                "updateContribution": {"id": contribution_id}
+            },
+        )
 
         data = {
             "title": "New Title",
             "url": "https://example.com",
             "description": "New desc",
             "type": "BLOGPOST",
-            "date": datetime(2024, 1, 1, 0, 0, 0).isoformat(),
+            "date": _ISO_2024_01_01,
         }
         res = await tool.update_contribution_impl("c1", data)
         assert res["success"] is True
 
-    @pytest.mark.asyncio
     async def test_update_contribution_logger_initialization(self):
         """Test that logger is properly initialized."""
         from github_stars_contrib_mcp.tools.update_contributions import logger
@@ -1,22 +1,16 @@
 """Unit tests for update_link tool (DI path)."""
 
-import pytest
-
 from github_stars_contrib_mcp.tools import update_link as tool
 
 
 class TestUpdateLink:
-    @pytest.mark.asyncio
-    async def test_update_link_success(self, monkeypatch):
-        class FakePort:
-            async def update_link(
-                self, link_id: str, link: str | None, platform: str | None
-            ):
-                return {
-                    "updateLink": {"id": link_id, "link": link, "platform": platform}
-                }
-
-        monkeypatch.setattr(tool, "get_stars_api", FakePort)
+    async def test_update_link_success(self, fake_stars_api):
+        fake_stars_api(
+            tool,
+            update_link=lambda link_id, link, platform: {
+                "updateLink": {"id": link_id, "link": link, "platform": platform}
+            },
+        )
 
         data = {"link": "https://updated.com", "platform": "WEBSITE"}
         res = await tool.update_link_impl("l1", data)
@@ -30,60 +24,43 @@ class TestUpdateLink:
             }
         }
 
-    @pytest.mark.asyncio
     async def test_update_link_invalid_url(self):
         data = {"link": "not-a-url"}
         res = await tool.update_link_impl("l1", data)
         assert res["success"] is False
         assert "url" in str(res["error"])
 
-    @pytest.mark.asyncio
     async def test_update_link_invalid_platform(self):
         data = {"platform": "INVALID"}
         res = await tool.update_link_impl("l1", data)
         assert res["success"] is False
         assert "platform" in str(res["error"])
 
-    @pytest.mark.asyncio
-    async def test_update_link_error_bubbles(self, monkeypatch):
-        class FailingPort:
-            async def update_link(
-                self, link_id: str, link: str | None, platform: str | None
-            ):
-                raise RuntimeError("API error")
-
-        monkeypatch.setattr(tool, "get_stars_api", FailingPort)
+    async def test_update_link_error_bubbles(self, fake_stars_api):
+        fake_stars_api(tool, update_link=RuntimeError("API error"))
         data = {"link": "https://example.com"}
         res = await tool.update_link_impl("l1", data)
         assert res["success"] is False
         assert res["error"] == "API error"
 
-    @pytest.mark.asyncio
-    async def test_update_link_partial_update(self, mock_shared_client, monkeypatch):
-        class FakePort2:
-            async def update_link(
-                self, link_id: str, link: str | None, platform: str | None
-            ):
-                return {"updateLink": {"id": link_id}}
-
-        monkeypatch.setattr(tool, "get_stars_api", FakePort2)
+    async def test_update_link_partial_update(self, fake_stars_api):
+        fake_stars_api(
+            tool,
+            update_link=lambda link_id, link, platform: {"updateLink": {"id": link_id}},
+        )
 
         data = {"platform": "GITHUB"}
         res = await tool.update_link_impl("l1", data)
         assert res["success"] is True
 
-    @pytest.mark.asyncio
-    async def test_update_link_alias_platform(self, monkeypatch):
+    async def test_update_link_alias_platform(self, fake_stars_api):
         calls = {}
 
-        class FakePort:
-            async def update_link(
-                self, link_id: str, link: str | None, platform: str | None
-            ):
-                calls["platform"] = platform
-                return {"updateLink": {"id": link_id, "platform": platform}}
+        def _update_link(link_id: str, link: str | None, platform: str | None):
+            calls["platform"] = platform
+            return {"updateLink": {"id": link_id, "platform": platform}}
 
-        monkeypatch.setattr(tool, "get_stars_api", FakePort)
+        fake_stars_api(tool, update_link=_update_link)
         res = await tool.update_link_impl("l1", {"platform": "GITHUB"})
         assert res["success"] is True
         assert calls["platform"] == "GITHUB"
@@ -92,7 +69,6 @@ class TestUpdateLink:
         assert res2["success"] is True
         assert calls["platform"] == "OTHER"
 
-    @pytest.mark.asyncio
     async def test_update_link_logger_initialization(self):
         """Test that logger is properly initialized."""
         from github_stars_contrib_mcp.tools.update_link import logger
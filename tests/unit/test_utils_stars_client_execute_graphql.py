@@ -1,104 +1,61 @@
-import json as pyjson
-
+import httpx
 import pytest
-
-from github_stars_contrib_mcp.utils.stars_client import StarsClient
-
-
-class FakeResponse:
-    def __init__(
-        self,
-        status_code=200,
-        json_data=None,
-        text="",
-        json_error=False,
-        gql_error=False,
-    ):
-        self.status_code = status_code
-        self._json_data = json_data or {}
-        self.text = text
-        self._json_error = json_error
-        self._gql_error = gql_error
-
-    def json(self):
-        if self._json_error:
-            raise pyjson.JSONDecodeError("bad", "{}", 0)
-        if self._gql_error:
-            return {"errors": [{"message": "GraphQL exploded"}]}
-        return self._json_data
-
-
-class FakeAsyncClient:
-    def __init__(self, response: FakeResponse):
-        self._response = response
-
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
-
-    async def post(self, url, json=None):  # noqa: A002
-        return self._response
-
-
-@pytest.mark.asyncio
-async def test_execute_graphql_http_error(monkeypatch):
-    sc = StarsClient(api_url="https://api", token="t")
-
-    def fake_async_client(*args, **kwargs):  # noqa: ANN001
-        return FakeAsyncClient(FakeResponse(status_code=500, text="oops"))
-
-    monkeypatch.setattr(
-        "github_stars_contrib_mcp.utils.stars_client.httpx.AsyncClient",
-        fake_async_client,
-    )
-    res = await sc._execute_graphql("query {}")
-    assert res["ok"] is False and "HTTP 500" in res["error"]
-
-
-@pytest.mark.asyncio
-async def test_execute_graphql_invalid_json(monkeypatch):
-    sc = StarsClient(api_url="https://api", token="t")
-
-    def fake_async_client(*args, **kwargs):  # noqa: ANN001
-        return FakeAsyncClient(FakeResponse(status_code=200, json_error=True))
-
-    monkeypatch.setattr(
-        "github_stars_contrib_mcp.utils.stars_client.httpx.AsyncClient",
-        fake_async_client,
-    )
-    res = await sc._execute_graphql("query {}")
-    assert res["ok"] is False and res["error"] == "Invalid JSON response"
-
-
-@pytest.mark.asyncio
-async def test_execute_graphql_graphql_error(monkeypatch):
-    sc = StarsClient(api_url="https://api", token="t")
-
-    def fake_async_client(*args, **kwargs):  # noqa: ANN001
-        return FakeAsyncClient(FakeResponse(status_code=200, gql_error=True))
-
-    monkeypatch.setattr(
-        "github_stars_contrib_mcp.utils.stars_client.httpx.AsyncClient",
-        fake_async_client,
-    )
-    res = await sc._execute_graphql("query {}")
-    assert res["ok"] is False and "GraphQL exploded" in res["error"]
-
-
-@pytest.mark.asyncio
-async def test_execute_graphql_success(monkeypatch):
-    sc = StarsClient(api_url="https://api", token="t")
-
-    def fake_async_client(*args, **kwargs):  # noqa: ANN001
-        return FakeAsyncClient(
-            FakeResponse(status_code=200, json_data={"data": {"ok": True}})
-        )
-
-    monkeypatch.setattr(
-        "github_stars_contrib_mcp.utils.stars_client.httpx.AsyncClient",
-        fake_async_client,
+import respx
+
+_API_URL = "https://api.example.com/"
+
+
+@pytest.fixture(scope="module")
+def _graphql_route():
+    """One respx router for the module, so httpx is patched once rather than per test."""
+    with respx.mock(assert_all_called=False) as router:
+        yield router.post(_API_URL)
+
+
+@pytest.fixture
+def graphql_route(_graphql_route):
+    _graphql_route.reset()
+    return _graphql_route
+
+
+@pytest.mark.parametrize(
+    ("response", "expected_ok", "expected_error"),
+    [
+        (httpx.Response(500, text="oops"), False, "HTTP 500"),
+        (httpx.Response(429, text="Rate limited"), False, "HTTP 429"),
+        (httpx.Response(200, content=b"not json"), False, "Invalid JSON response"),
+        (
+            httpx.Response(200, json={"errors": [{"message": "GraphQL exploded"}]}),
+            False,
+            "GraphQL exploded",
+        ),
+        (httpx.Response(200, json={"data": {"ok": True}}), True, None),
+    ],
+    ids=["http_error", "rate_limited", "invalid_json", "graphql_error", "success"],
+)
+async def test_execute_graphql(
+    stars_client, graphql_route, response, expected_ok, expected_error
+):
+    graphql_route.mock(return_value=response)
+    res = await stars_client._execute_graphql("query {}")
+    assert res["ok"] is expected_ok
+    if expected_error is None:
+        assert res["data"] == {"ok": True}
+    else:
+        assert expected_error in res["error"]
+    assert graphql_route.call_count == 1
+
+
+async def test_execute_graphql_retries_transport_errors(
+    stars_client, graphql_route, _no_retry_backoff
+):
+    graphql_route.mock(
+        side_effect=[
+            httpx.ConnectError("reset"),
+            httpx.Response(200, json={"data": {"ok": True}}),
+        ]
     )
-    res = await sc._execute_graphql("query {}")
-    assert res["ok"] is True and res["data"] == {"ok": True}
+    res = await stars_client._execute_graphql("query {}")
+    assert res["ok"] is True
+    assert graphql_route.call_count == 2
+    _no_retry_backoff.assert_awaited_once()